@@ -3,15 +3,24 @@ Indic TTS API Server
 Flask-based REST API for FastSpeech2 + HiFi-GAN Text-to-Speech synthesis
 """
 import os
-import io
+import struct
+import hashlib
 import logging
-from flask import Flask, request, jsonify, send_file
+import threading
+from collections import OrderedDict
+from typing import List
+
+from flask import Flask, request, jsonify, Response, stream_with_context
 from werkzeug.exceptions import BadRequest, InternalServerError
 import numpy as np
-from scipy.io.wavfile import write as write_wav
+import orjson
+from pydantic import BaseModel, ValidationError, constr
 
 from src.tts_engine import TTSEngine
 from src.config import Config
+from src.inference_worker import InferenceClient
+from src.batcher import BatchedTTS
+from src.model_store import ModelStore
 
 # Configure logging
 logging.basicConfig(
@@ -27,45 +36,298 @@ config = Config()
 # Initialize TTS Engine (lazy loading)
 tts_engine = None
 
+# Optional dedicated inference process (INFERENCE_PROCESS=1): keeps PyTorch
+# compute off the web workers and returns audio via shared memory
+_INFERENCE_PROCESS = os.getenv('INFERENCE_PROCESS', '').lower() in ('1', 'true', 'yes')
+inference_client = None
+_inference_client_pid = None
+_inference_client_lock = threading.Lock()
+
+
+def get_inference_client():
+    """
+    Get or create this process's InferenceClient
+
+    Created lazily per serving process (keyed on pid): the client's
+    collector thread doesn't survive a fork, so a client built at import
+    in a pre-forking server's master would strand every worker's requests.
+    """
+    global inference_client, _inference_client_pid
+    pid = os.getpid()
+    if inference_client is None or _inference_client_pid != pid:
+        with _inference_client_lock:
+            if inference_client is None or _inference_client_pid != pid:
+                logger.info("Starting dedicated inference worker process")
+                inference_client = InferenceClient(config)
+                _inference_client_pid = pid
+    return inference_client
+
+# Optional micro-batching (ENABLE_BATCHING=1): concurrent same-voice
+# requests collected within a short window share one engine dispatch
+_BATCHING_ENABLED = os.getenv('ENABLE_BATCHING', '').lower() in ('1', 'true', 'yes')
+tts_batcher = None
+_batcher_lock = threading.Lock()
+
+
+def get_tts_batcher():
+    """Get or create the micro-batching front end"""
+    global tts_batcher
+    if tts_batcher is None:
+        with _batcher_lock:
+            if tts_batcher is None:
+                tts_batcher = BatchedTTS(get_tts_engine())
+    return tts_batcher
+
+class SynthesizeRequest(BaseModel):
+    """Schema for POST /synthesize"""
+    text: constr(min_length=1)
+    language: constr(min_length=1)
+    gender: constr(min_length=1)
+    alpha: float = 1.0
+
+
+class PreloadSpec(BaseModel):
+    """One language/gender pair in a preload request"""
+    language: constr(min_length=1)
+    gender: constr(min_length=1)
+
+
+class PreloadRequest(BaseModel):
+    """Schema for POST /preload"""
+    models: List[PreloadSpec] = []
+
+
+def _json(obj, status=200):
+    """JSON response via orjson's C encoder; cheaper than jsonify for the
+    small payloads served to frequent pollers"""
+    return Response(orjson.dumps(obj), status=status,
+                    mimetype='application/json')
+
+
+def _parse_request(schema):
+    """Decode and validate the request body against a pydantic schema"""
+    if not request.is_json:
+        raise BadRequest("Content-Type must be application/json")
+    try:
+        return schema.parse_raw(request.get_data(cache=False))
+    except ValidationError as e:
+        raise BadRequest(str(e))
+
+
+# Template for a 44-byte PCM16 mono RIFF header; sizes and rates are
+# patched per response, everything else is constant
+_WAV_HEADER_TEMPLATE = struct.pack(
+    '<4sI4s4sIHHIIHH4sI',
+    b'RIFF', 0, b'WAVE',
+    b'fmt ', 16, 1, 1, 0, 0, 2, 16,
+    b'data', 0
+)
+
+
+def _wav_header(n_samples: int, sampling_rate: int) -> bytes:
+    """Build a RIFF/WAV header for 16-bit mono PCM audio"""
+    n_bytes = 2 * n_samples
+    header = bytearray(_WAV_HEADER_TEMPLATE)
+    struct.pack_into('<I', header, 4, 36 + n_bytes)           # RIFF chunk size
+    struct.pack_into('<II', header, 24,
+                     sampling_rate, sampling_rate * 2)        # sample/byte rate
+    struct.pack_into('<I', header, 40, n_bytes)               # data chunk size
+    return bytes(header)
+
+
+# ~64 KB of int16 PCM per yielded chunk
+_STREAM_CHUNK_SAMPLES = 32768
+
+# LRU of complete WAV responses keyed by request content; identical retries
+# and health-check style traffic skip inference entirely (CACHE_SIZE=0
+# disables)
+_RESPONSE_CACHE_SIZE = int(os.getenv('CACHE_SIZE', 128))
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(text, language, gender, alpha):
+    """Digest identifying one synthesis request"""
+    return hashlib.sha256(
+        f'{text}|{language}|{gender}|{alpha:.3f}'.encode('utf-8')
+    ).digest()
+
+
+def _response_cache_get(key):
+    """Return cached WAV bytes for a key, refreshing its LRU position"""
+    if _RESPONSE_CACHE_SIZE <= 0:
+        return None
+    with _response_cache_lock:
+        wav = _response_cache.get(key)
+        if wav is not None:
+            _response_cache.move_to_end(key)
+        return wav
+
+
+def _response_cache_put(key, wav):
+    """Store WAV bytes for a key, evicting the least recently used entry"""
+    if _RESPONSE_CACHE_SIZE <= 0:
+        return
+    with _response_cache_lock:
+        _response_cache[key] = wav
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+# Per-thread scratch buffer for float->int16 conversion, grown to the next
+# power of two so repeated requests reuse one allocation
+_PCM_SCRATCH = threading.local()
+
+
+def _to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """Convert a waveform to int16 PCM, reusing a per-thread scratch buffer"""
+    if not np.issubdtype(audio.dtype, np.floating):
+        return audio.astype(np.int16, copy=False)
+
+    scratch = getattr(_PCM_SCRATCH, 'buf', None)
+    if scratch is None or len(scratch) < len(audio):
+        size = 1 << max(10, (len(audio) - 1).bit_length())
+        scratch = np.empty(size, dtype=np.float32)
+        _PCM_SCRATCH.buf = scratch
+
+    out = scratch[:len(audio)]
+    np.multiply(audio, 32767.0, out=out)
+    np.clip(out, -32768.0, 32767.0, out=out)
+    return out.astype(np.int16)
+
+
+def _stream_wav(pcm, sampling_rate):
+    """Yield a WAV response incrementally: header first, then PCM chunks"""
+    yield _wav_header(len(pcm), sampling_rate)
+    for i in range(0, len(pcm), _STREAM_CHUNK_SAMPLES):
+        yield pcm[i:i + _STREAM_CHUNK_SAMPLES].tobytes()
+
+
+def _stream_wav_caching(pcm, sampling_rate, cache_key):
+    """Stream the WAV while accumulating it for the response cache"""
+    parts = []
+    for chunk in _stream_wav(pcm, sampling_rate):
+        parts.append(chunk)
+        yield chunk
+    _response_cache_put(cache_key, b''.join(parts))
+
+
+# Engine-less model lookups for INFERENCE_PROCESS mode, where the web
+# process must never build a local engine
+_model_store = None
+_model_store_lock = threading.Lock()
+
+
+def get_model_store():
+    """Get or create a ModelStore for lookups that don't need the engine"""
+    global _model_store
+    if _model_store is None:
+        with _model_store_lock:
+            if _model_store is None:
+                _model_store = ModelStore(config.models_dir, config.gcs_bucket)
+    return _model_store
+
+
+_engine_lock = threading.Lock()
+
 
 def get_tts_engine():
     """Get or create TTS engine instance"""
+    # Double-checked lock: the warm-up thread and an early request can
+    # race here, and losing that race would build (and preload) two full
+    # engines
     global tts_engine
     if tts_engine is None:
-        logger.info("Initializing TTS Engine...")
-        tts_engine = TTSEngine(config)
-        logger.info("TTS Engine initialized successfully")
+        with _engine_lock:
+            if tts_engine is None:
+                logger.info("Initializing TTS Engine...")
+                tts_engine = TTSEngine(config)
+                logger.info("TTS Engine initialized successfully")
     return tts_engine
 
 
+# Set once the warm-up thread has initialized the engine and preloaded models
+_warmup_done = threading.Event()
+
+
+def _warm_up():
+    """Initialize the engine (and its preloaded models) off the request path"""
+    try:
+        get_tts_engine()
+    except Exception as e:
+        logger.error(f"Warm-up failed: {e}", exc_info=True)
+    finally:
+        _warmup_done.set()
+
+
+# When preloaded under Gunicorn (see api/gunicorn_conf.py), build the engine
+# at import time so forked workers share the loaded weights copy-on-write;
+# otherwise warm up in the background so the first request doesn't pay the
+# full model-load cost. With a dedicated inference process there is no
+# local engine at all — building one here would load every model twice.
+if _INFERENCE_PROCESS:
+    _warmup_done.set()
+elif os.getenv('EAGER_INIT', '').lower() in ('1', 'true', 'yes'):
+    get_tts_engine()
+    _warmup_done.set()
+else:
+    threading.Thread(target=_warm_up, name='tts-warmup', daemon=True).start()
+
+
+@app.route('/livez', methods=['GET'])
+def liveness_check():
+    """Liveness probe: the process is up, regardless of model state"""
+    return _json({'status': 'alive'})
+
+
 @app.route('/healthz', methods=['GET'])
+@app.route('/readyz', methods=['GET'])
 def health_check():
-    """Health check endpoint"""
+    """Readiness probe (healthz kept as an alias for compatibility)"""
+    # Report not-ready while models are still warming so orchestrators only
+    # route traffic once the engine is hot; never trigger lazy init from a
+    # probe
+    if not _warmup_done.is_set():
+        return _json({'status': 'warming_up'}, 503)
+
+    if _INFERENCE_PROCESS:
+        # Synthesis runs in the dedicated worker process; this process is
+        # ready as soon as it is serving
+        return _json({'status': 'healthy', 'mode': 'inference_worker'})
+
+    if tts_engine is None:
+        return _json({'status': 'warming_up'}, 503)
+
     try:
-        engine = get_tts_engine()
-        return jsonify({
+        engine = tts_engine
+        return _json({
             'status': 'healthy',
             'device': engine.device,
             'models_loaded': len(engine.model_cache)
-        }), 200
+        })
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
-        return jsonify({'status': 'unhealthy', 'error': str(e)}), 503
+        return _json({'status': 'unhealthy', 'error': str(e)}, 503)
 
 
 @app.route('/languages', methods=['GET'])
 def list_languages():
     """List available languages and genders"""
     try:
-        engine = get_tts_engine()
-        available = engine.get_available_models()
-        return jsonify({
+        # Listing only needs the model store; with a dedicated inference
+        # process, never pull a full local engine into the web process
+        if _INFERENCE_PROCESS:
+            available = get_model_store().list_available_models()
+        else:
+            available = get_tts_engine().get_available_models()
+        return _json({
             'languages': available,
             'count': sum(len(genders) for genders in available.values())
-        }), 200
+        })
     except Exception as e:
         logger.error(f"Failed to list languages: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        return _json({'error': str(e)}, 500)
 
 
 @app.route('/synthesize', methods=['POST'])
@@ -84,51 +346,70 @@ def synthesize():
     Returns: audio/wav file
     """
     try:
-        # Parse request
-        if not request.is_json:
-            raise BadRequest("Content-Type must be application/json")
-        
-        data = request.get_json()
-        
-        # Validate required fields
-        text = data.get('text')
-        language = data.get('language')
-        gender = data.get('gender')
-        
-        if not text:
-            raise BadRequest("'text' field is required")
-        if not language:
-            raise BadRequest("'language' field is required")
-        if not gender:
-            raise BadRequest("'gender' field is required")
-        
-        # Optional parameters
-        alpha = float(data.get('alpha', 1.0))
-        
+        # Parse and validate request in one pass
+        req = _parse_request(SynthesizeRequest)
+        text, language, gender, alpha = req.text, req.language, req.gender, req.alpha
+
         logger.info(f"Synthesis request: language={language}, gender={gender}, "
                    f"text_length={len(text)}, alpha={alpha}")
-        
-        # Get TTS engine and synthesize
-        engine = get_tts_engine()
-        audio_array = engine.synthesize(
-            text=text,
-            language=language,
-            gender=gender,
-            alpha=alpha
-        )
-        
-        # Convert to WAV format in memory
-        buffer = io.BytesIO()
-        write_wav(buffer, engine.sampling_rate, audio_array)
-        buffer.seek(0)
-        
-        logger.info(f"Synthesis successful: {len(audio_array)} samples generated")
-        
-        return send_file(
-            buffer,
+
+        # Identical requests are served straight from the response cache
+        cache_key = _response_cache_key(text, language, gender, alpha)
+        cached_wav = _response_cache_get(cache_key)
+        if cached_wav is not None:
+            logger.info(f"Serving cached synthesis result ({len(cached_wav)} bytes)")
+            return Response(
+                cached_wav,
+                mimetype='audio/wav',
+                headers={
+                    'Content-Disposition':
+                        f'attachment; filename="{language}_{gender}_output.wav"'
+                }
+            )
+
+        # Synthesize in the dedicated worker process when configured,
+        # otherwise in-process
+        if _INFERENCE_PROCESS:
+            audio_array = get_inference_client().synthesize(
+                text=text,
+                language=language,
+                gender=gender,
+                alpha=alpha
+            )
+            sampling_rate = config.sampling_rate
+        elif _BATCHING_ENABLED:
+            audio_array = get_tts_batcher().synthesize(
+                text=text,
+                language=language,
+                gender=gender,
+                alpha=alpha
+            )
+            sampling_rate = get_tts_engine().sampling_rate
+        else:
+            engine = get_tts_engine()
+            audio_array = engine.synthesize(
+                text=text,
+                language=language,
+                gender=gender,
+                alpha=alpha
+            )
+            sampling_rate = engine.sampling_rate
+
+        # Clip and cast to int16 PCM (no-op if the engine already emits int16)
+        pcm = _to_pcm16(audio_array)
+
+        logger.info(f"Synthesis successful: {len(pcm)} samples generated")
+
+        # Stream header + PCM chunks instead of buffering the full WAV,
+        # filling the response cache as a side effect
+        return Response(
+            stream_with_context(_stream_wav_caching(pcm, sampling_rate, cache_key)),
             mimetype='audio/wav',
-            as_attachment=True,
-            download_name=f'{language}_{gender}_output.wav'
+            headers={
+                'Content-Length': str(44 + 2 * len(pcm)),
+                'Content-Disposition':
+                    f'attachment; filename="{language}_{gender}_output.wav"'
+            }
         )
         
     except BadRequest as e:
@@ -153,27 +434,24 @@ def preload_models():
     }
     """
     try:
-        if not request.is_json:
-            raise BadRequest("Content-Type must be application/json")
-        
-        data = request.get_json()
-        models = data.get('models', [])
-        
-        if not isinstance(models, list):
-            raise BadRequest("'models' must be a list")
-        
+        # The inference worker owns the models in this mode; building a
+        # local engine here would load everything twice
+        if _INFERENCE_PROCESS:
+            return jsonify({
+                'error': 'Preloading is unavailable with INFERENCE_PROCESS: '
+                         'the worker process loads models on demand'
+            }), 501
+
+        req = _parse_request(PreloadRequest)
+
         engine = get_tts_engine()
         loaded = []
         failed = []
-        
-        for model_spec in models:
-            language = model_spec.get('language')
-            gender = model_spec.get('gender')
-            
-            if not language or not gender:
-                failed.append({'spec': model_spec, 'error': 'Missing language or gender'})
-                continue
-            
+
+        for model_spec in req.models:
+            language = model_spec.language
+            gender = model_spec.gender
+
             try:
                 engine.load_model(language, gender)
                 loaded.append({'language': language, 'gender': gender})
@@ -191,7 +469,10 @@ def preload_models():
             'failed': failed,
             'total_cached': len(engine.model_cache)
         }), 200
-        
+
+    except BadRequest as e:
+        logger.warning(f"Bad request: {str(e)}")
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Preload failed: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -200,18 +481,20 @@ def preload_models():
 @app.route('/', methods=['GET'])
 def index():
     """API information endpoint"""
-    return jsonify({
+    return _json({
         'service': 'Indic TTS API',
         'version': '1.0.0',
         'endpoints': {
             'GET /': 'This information page',
-            'GET /healthz': 'Health check',
+            'GET /livez': 'Liveness probe',
+            'GET /readyz': 'Readiness probe (models warmed up)',
+            'GET /healthz': 'Health check (alias of /readyz)',
             'GET /languages': 'List available languages',
             'POST /synthesize': 'Synthesize speech from text',
             'POST /preload': 'Preload models into memory'
         },
         'documentation': 'See README.md for detailed API usage'
-    }), 200
+    })
 
 
 @app.errorhandler(404)
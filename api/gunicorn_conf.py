@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for the Indic TTS API
+
+On CPU, preload_app imports api.app in the master process before forking,
+so with EAGER_INIT the TTS engine (and any preloaded model weights) is
+built once and shared copy-on-write across workers instead of duplicated
+per worker.
+
+On CUDA this must stay off: initializing a CUDA context in the master
+poisons every forked worker ("Cannot re-initialize CUDA in forked
+subprocess"), so each worker builds its own engine lazily instead.
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+workers = int(os.getenv('WORKERS', 4))
+worker_class = 'gthread'
+threads = int(os.getenv('WORKER_THREADS', 4))
+preload_app = os.getenv('DEVICE', 'cuda').lower() == 'cpu'
+timeout = 120
+keepalive = 5
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
+accesslog = '-'
+errorlog = '-'
+
+# Build the engine at import time in the master so forked workers inherit
+# the loaded weights read-only (see api/app.py); CUDA workers warm up
+# per-process instead
+if preload_app:
+    os.environ.setdefault('EAGER_INIT', '1')
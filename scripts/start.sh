@@ -18,14 +18,8 @@ if [ -n "$PRELOAD_MODELS" ]; then
     echo "Preloading models: $PRELOAD_MODELS"
 fi
 
-# Start gunicorn with the Flask app
+# Start gunicorn with the Flask app (workers/threads/preload configured in
+# api/gunicorn_conf.py)
 exec gunicorn \
-    --bind 0.0.0.0:${PORT:-8080} \
-    --workers ${WORKERS:-1} \
-    --worker-class gevent \
-    --timeout 300 \
-    --keep-alive 5 \
-    --log-level ${LOG_LEVEL:-info} \
-    --access-logfile - \
-    --error-logfile - \
+    --config /app/api/gunicorn_conf.py \
     api.app:app
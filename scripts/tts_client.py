@@ -3,26 +3,34 @@
 Python client for testing Indic TTS API
 """
 import requests
+from requests.adapters import HTTPAdapter
 import argparse
+import shutil
 import sys
 from pathlib import Path
 
 
 class TTSClient:
     """Simple client for Indic TTS API"""
-    
+
     def __init__(self, base_url: str = "http://localhost:8080"):
         self.base_url = base_url.rstrip('/')
-    
+        # Reuse one TCP/TLS connection across calls instead of paying a
+        # fresh handshake per request (matters for batch synthesis loops)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def health_check(self):
         """Check API health"""
-        response = requests.get(f"{self.base_url}/healthz")
+        response = self.session.get(f"{self.base_url}/healthz")
         response.raise_for_status()
         return response.json()
-    
+
     def list_languages(self):
         """List available languages"""
-        response = requests.get(f"{self.base_url}/languages")
+        response = self.session.get(f"{self.base_url}/languages")
         response.raise_for_status()
         return response.json()
     
@@ -37,9 +45,9 @@ class TTSClient:
             gender: Voice gender (male/female)
             alpha: Speed control (default 1.0)
             output_file: Path to save audio file
-        
+
         Returns:
-            Audio bytes
+            Audio bytes, or None when streamed directly to output_file
         """
         payload = {
             "text": text,
@@ -47,21 +55,24 @@ class TTSClient:
             "gender": gender,
             "alpha": alpha
         }
-        
-        response = requests.post(
+
+        with self.session.post(
             f"{self.base_url}/synthesize",
             json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        response.raise_for_status()
-        
-        audio_data = response.content
-        
-        if output_file:
-            Path(output_file).write_bytes(audio_data)
-            print(f"Audio saved to: {output_file}")
-        
-        return audio_data
+            headers={"Content-Type": "application/json"},
+            stream=True
+        ) as response:
+            response.raise_for_status()
+
+            if output_file:
+                # Stream straight to disk; keeps memory constant for
+                # multi-minute clips
+                with open(output_file, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=65536)
+                print(f"Audio saved to: {output_file}")
+                return None
+
+            return response.content
     
     def preload_models(self, models: list):
         """
@@ -71,7 +82,7 @@ class TTSClient:
             models: List of dicts with 'language' and 'gender' keys
         """
         payload = {"models": models}
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/preload",
             json=payload,
             headers={"Content-Type": "application/json"}
@@ -0,0 +1,115 @@
+"""
+Dynamic request batching for TTS synthesis
+
+Collects concurrent /synthesize requests for a short window, groups them by
+(language, gender) so every request in a group shares the same model
+weights, and dispatches each group in one call. When the engine exposes
+synthesize_batch the whole group runs as a single padded forward pass;
+otherwise the group still executes back-to-back on a warm model.
+"""
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+
+class BatchedTTS:
+    """Micro-batching front end for a TTSEngine"""
+
+    def __init__(self, engine, window_ms: float = None, max_batch: int = None):
+        """
+        Initialize the batcher and start its collector thread
+
+        Args:
+            engine: TTSEngine instance to dispatch to
+            window_ms: How long to wait for more requests after the first
+            max_batch: Maximum requests dispatched in one group
+        """
+        self.engine = engine
+        if window_ms is None:
+            window_ms = float(os.getenv('BATCH_WINDOW_MS', 5))
+        if max_batch is None:
+            max_batch = int(os.getenv('MAX_BATCH', 8))
+        self.window = window_ms / 1000.0
+        self.max_batch = max_batch
+
+        self._queue = queue.Queue()
+        threading.Thread(target=self._run, name='tts-batcher',
+                         daemon=True).start()
+
+    def synthesize(self, text: str, language: str, gender: str,
+                   alpha: float = 1.0):
+        """Queue a request and block until its audio is ready"""
+        # Validate before enqueueing: an oversized text must fail its own
+        # caller, not the unrelated requests it would be co-batched with
+        max_length = self.engine.config.max_text_length
+        if len(text) > max_length:
+            raise ValueError(
+                f"Text too long ({len(text)} chars). Maximum: {max_length}"
+            )
+
+        future = Future()
+        self._queue.put((text, language, gender, alpha, future))
+        return future.result()
+
+    def _run(self):
+        """Collect requests for up to the batch window, then dispatch"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def _dispatch(self, batch):
+        """Group a batch by voice and run each group through the engine"""
+        groups = {}
+        for text, language, gender, alpha, future in batch:
+            groups.setdefault((language, gender), []).append(
+                (text, alpha, future))
+
+        for (language, gender), items in groups.items():
+            texts = [text for text, _, _ in items]
+            alphas = [alpha for _, alpha, _ in items]
+            try:
+                if hasattr(self.engine, 'synthesize_batch'):
+                    results = self.engine.synthesize_batch(
+                        texts, language, gender, alphas)
+                else:
+                    results = [
+                        self.engine.synthesize(
+                            text=text, language=language,
+                            gender=gender, alpha=alpha)
+                        for text, alpha in zip(texts, alphas)
+                    ]
+            except Exception as e:
+                # Retry the group one text at a time so only the request
+                # that actually fails sees the error instead of everyone
+                # co-batched with it
+                logger.warning(
+                    f"Batched synthesis failed for {language}/{gender}: {e}. "
+                    f"Retrying texts individually.")
+                for text, alpha, future in items:
+                    try:
+                        future.set_result(self.engine.synthesize(
+                            text=text, language=language,
+                            gender=gender, alpha=alpha))
+                    except Exception as per_text_error:
+                        logger.error(
+                            f"Synthesis failed for {language}/{gender}: "
+                            f"{per_text_error}", exc_info=True)
+                        future.set_exception(per_text_error)
+                continue
+
+            for (_, _, future), audio in zip(items, results):
+                future.set_result(audio)
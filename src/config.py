@@ -2,6 +2,7 @@
 Configuration management for Indic TTS API
 """
 import os
+import sys
 from typing import Optional, List, Tuple
 from dotenv import load_dotenv
 
@@ -19,6 +20,17 @@ class Config:
         
         # Device configuration
         self.device = os.getenv('DEVICE', 'cuda')  # 'cuda' or 'cpu'
+
+        # Inference precision for the vocoder: fp32, fp16 or bf16 (CUDA).
+        # Lower precision halves the bytes moved per forward at a small
+        # potential quality cost. int8 is accepted but falls back to fp32
+        # with a warning: the conv stack isn't dynamically quantizable.
+        self.precision = os.getenv('PRECISION', 'fp32').lower()
+
+        # Vocoder execution backend: 'torch' (default) or 'onnxruntime'.
+        # The ONNX path exports HiFi-GAN once per voice and runs it under
+        # ONNX Runtime, using the TensorRT provider when available.
+        self.vocoder_backend = os.getenv('VOCODER_BACKEND', 'torch').lower()
         
         # Preload models on startup
         self.preload_models = self._parse_preload_models()
@@ -32,6 +44,8 @@ class Config:
         self.sampling_rate = int(os.getenv('SAMPLING_RATE', 22050))
         self.max_text_length = int(os.getenv('MAX_TEXT_LENGTH', 5000))
         self.chunk_words = int(os.getenv('CHUNK_WORDS', 100))
+        self.max_cached_models = int(os.getenv('MAX_CACHED_MODELS', 8))
+        self.max_silence_sec = float(os.getenv('MAX_SILENCE_SEC', 10))
         
         # Logging
         self.log_level = os.getenv('LOG_LEVEL', 'INFO')
@@ -49,19 +63,22 @@ class Config:
         if not preload_str:
             return []
         
-        models = []
+        # Dedupe (preserving order) so a misconfigured env var can't load
+        # the same weights twice; intern the strings so downstream cache
+        # lookups compare by pointer
+        models = {}
         for item in preload_str.split(','):
             item = item.strip()
             if not item:
                 continue
-            
+
             parts = item.split(':')
             if len(parts) == 2:
                 language, gender = parts[0].strip(), parts[1].strip()
                 if language and gender:
-                    models.append((language, gender))
-        
-        return models
+                    models.setdefault((sys.intern(language), sys.intern(gender)))
+
+        return list(models.keys())
     
     def __repr__(self):
         return (
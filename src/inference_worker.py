@@ -0,0 +1,162 @@
+"""
+Inference Worker - runs TTS synthesis in a dedicated process
+
+Keeps PyTorch compute off the Flask worker threads: requests are posted to
+an input queue, the worker process runs TTSEngine.synthesize, and the audio
+comes back through POSIX shared memory so the ~MB waveform is never
+pickled. On Python < 3.8 (no multiprocessing.shared_memory) the raw bytes
+travel through the result queue instead.
+"""
+import itertools
+import logging
+import multiprocessing as mp
+import threading
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+logger = logging.getLogger(__name__)
+
+# Sentinel posted to the request queue to stop the worker
+_SHUTDOWN = None
+
+# Spawn, not fork: the worker must start from a clean interpreter so the
+# parent's torch/CUDA state (if any) is never inherited
+_spawn_ctx = mp.get_context('spawn')
+
+
+class InferenceWorker(_spawn_ctx.Process):
+    """Persistent synthesis process fed by a request queue"""
+
+    def __init__(self, config, in_queue, out_queue):
+        super().__init__(name='tts-inference', daemon=True)
+        self.config = config
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+
+    def run(self):
+        # Import here so torch/CUDA initialize in this process only
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine(self.config)
+        logger.info("Inference worker ready")
+
+        while True:
+            item = self.in_queue.get()
+            if item is _SHUTDOWN:
+                break
+
+            req_id, text, language, gender, alpha = item
+            try:
+                audio = engine.synthesize(
+                    text=text,
+                    language=language,
+                    gender=gender,
+                    alpha=alpha
+                )
+                self.out_queue.put((req_id, self._pack(audio), None))
+            except Exception as e:
+                logger.error(f"Synthesis failed in worker: {e}", exc_info=True)
+                self.out_queue.put((req_id, None, str(e)))
+
+    @staticmethod
+    def _pack(audio: np.ndarray):
+        """Hand audio back via shared memory when available"""
+        if shared_memory is None:
+            return ('bytes', audio.tobytes(), len(audio), str(audio.dtype))
+
+        shm = shared_memory.SharedMemory(create=True, size=max(1, audio.nbytes))
+        try:
+            np.frombuffer(shm.buf, dtype=audio.dtype, count=len(audio))[:] = audio
+            return ('shm', shm.name, len(audio), str(audio.dtype))
+        finally:
+            # The requesting process unlinks after reading
+            shm.close()
+
+
+class InferenceClient:
+    """
+    Request-side handle to the InferenceWorker process
+
+    Must be created in the process that serves requests: the collector
+    thread routing results back to waiters does not survive a fork, so a
+    client built before a pre-forking server splits off its workers would
+    leave every forked worker waiting on results the parent consumes.
+    """
+
+    def __init__(self, config, timeout: float = 300.0):
+        self.config = config
+        self.timeout = timeout
+
+        self.in_queue = _spawn_ctx.Queue()
+        self.out_queue = _spawn_ctx.Queue()
+        self.worker = InferenceWorker(config, self.in_queue, self.out_queue)
+        self.worker.start()
+
+        self._req_ids = itertools.count()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        threading.Thread(target=self._collect, name='tts-inference-collect',
+                         daemon=True).start()
+
+    def _collect(self):
+        """Route worker results back to the waiting request threads"""
+        while True:
+            req_id, payload, error = self.out_queue.get()
+            with self._pending_lock:
+                slot = self._pending.pop(req_id, None)
+            if slot is None:
+                # Requester gave up (timeout); drop the result
+                self._discard(payload)
+                continue
+            slot['payload'] = payload
+            slot['error'] = error
+            slot['event'].set()
+
+    @staticmethod
+    def _discard(payload):
+        """Release shared memory for a result nobody is waiting on"""
+        if payload and payload[0] == 'shm' and shared_memory is not None:
+            try:
+                shm = shared_memory.SharedMemory(name=payload[1])
+                shm.close()
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def synthesize(self, text: str, language: str, gender: str,
+                   alpha: float = 1.0) -> np.ndarray:
+        """Run synthesis in the worker process and return the audio array"""
+        req_id = next(self._req_ids)
+        slot = {'event': threading.Event(), 'payload': None, 'error': None}
+        with self._pending_lock:
+            self._pending[req_id] = slot
+
+        self.in_queue.put((req_id, text, language, gender, alpha))
+
+        if not slot['event'].wait(self.timeout):
+            with self._pending_lock:
+                self._pending.pop(req_id, None)
+            raise RuntimeError("Inference worker timed out")
+
+        if slot['error'] is not None:
+            raise RuntimeError(slot['error'])
+
+        kind, data, n_samples, dtype = slot['payload']
+        if kind == 'shm':
+            shm = shared_memory.SharedMemory(name=data)
+            try:
+                return np.frombuffer(shm.buf, dtype=dtype, count=n_samples).copy()
+            finally:
+                shm.close()
+                shm.unlink()
+        return np.frombuffer(data, dtype=dtype, count=n_samples)
+
+    def shutdown(self):
+        """Stop the worker process"""
+        self.in_queue.put(_SHUTDOWN)
+        self.worker.join(timeout=10)
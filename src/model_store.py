@@ -3,13 +3,25 @@ Model Store - Handles downloading and caching models from GCS
 """
 import os
 import logging
+import time
 from pathlib import Path
 from typing import Optional, Tuple
 import threading
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 
 logger = logging.getLogger(__name__)
 
+# Files that must be present for a voice/vocoder to be usable
+_REQUIRED_MODEL_FILES = frozenset({
+    'config.yaml',
+    'model.pth',
+    'feats_stats.npz',
+    'pitch_stats.npz',
+    'energy_stats.npz'
+})
+_REQUIRED_VOCODER_FILES = frozenset({'config.json', 'generator'})
+
 
 class ModelStore:
     """Manages model downloads from GCS and local caching"""
@@ -37,17 +49,20 @@ class ModelStore:
                 logger.info(f"Connected to GCS bucket: {bucket_name}")
             except Exception as e:
                 logger.warning(f"Failed to connect to GCS: {e}. Using local models only.")
-        
-        # Thread lock for concurrent downloads
+
+        # Cached result of list_available_models: (monotonic ts, result)
+        self._available_cache = None
+        self._available_cache_ttl = 30.0
+
+        # Per-key download locks; the key space is two entries per voice,
+        # so it never needs bounding
         self._download_locks = {}
-        self._lock_mutex = threading.Lock()
-    
+
     def _get_download_lock(self, key: str) -> threading.Lock:
         """Get or create a lock for a specific download key"""
-        with self._lock_mutex:
-            if key not in self._download_locks:
-                self._download_locks[key] = threading.Lock()
-            return self._download_locks[key]
+        # dict.setdefault is atomic in CPython, so concurrent misses for
+        # the same key always converge on one lock without a global mutex
+        return self._download_locks.setdefault(key, threading.Lock())
     
     def get_model_path(self, language: str, gender: str) -> Path:
         """Get local path for model files"""
@@ -70,21 +85,22 @@ class ModelStore:
     
     def model_exists_locally(self, language: str, gender: str) -> bool:
         """Check if model files exist locally"""
+        # One scandir instead of one stat per required file
         model_path = self.get_model_path(language, gender)
-        required_files = [
-            'config.yaml',
-            'model.pth',
-            'feats_stats.npz',
-            'pitch_stats.npz',
-            'energy_stats.npz'
-        ]
-        return all((model_path / f).exists() for f in required_files)
-    
+        try:
+            names = {entry.name for entry in os.scandir(model_path)}
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        return _REQUIRED_MODEL_FILES.issubset(names)
+
     def vocoder_exists_locally(self, language: str, gender: str) -> bool:
         """Check if vocoder files exist locally"""
         vocoder_path = self.get_vocoder_path(language, gender)
-        required_files = ['config.json', 'generator']
-        return all((vocoder_path / f).exists() for f in required_files)
+        try:
+            names = {entry.name for entry in os.scandir(vocoder_path)}
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        return _REQUIRED_VOCODER_FILES.issubset(names)
     
     def download_from_gcs(self, gcs_prefix: str, local_path: Path) -> bool:
         """
@@ -111,25 +127,48 @@ class ModelStore:
                 logger.warning(f"No files found in GCS with prefix: {gcs_prefix}")
                 return False
             
-            logger.info(f"Downloading {len(blobs)} files from gs://{self.gcs_bucket.name}/{gcs_prefix}")
-            
-            for blob in blobs:
-                # Skip directory markers
-                if blob.name.endswith('/'):
-                    continue
-                
-                # Calculate relative path
-                rel_path = blob.name[len(gcs_prefix):].lstrip('/')
-                if not rel_path:
-                    # This is the prefix itself (directory marker)
-                    continue
-                
-                dest_file = local_path / rel_path
+            # Skip directory markers and keep paths relative to the prefix
+            prefix = gcs_prefix.rstrip('/') + '/'
+            file_blobs = [b for b in blobs
+                          if b.name.startswith(prefix)
+                          and not b.name.endswith('/')]
+
+            if not file_blobs:
+                logger.warning(f"No files found in GCS with prefix: {gcs_prefix}")
+                return False
+
+            logger.info(f"Downloading {len(file_blobs)} files from gs://{self.gcs_bucket.name}/{gcs_prefix}")
+
+            blob_file_pairs = []
+            for blob in file_blobs:
+                # Leave chunk_size unset: a blob with chunk_size downloads
+                # via ChunkedDownload, which silently skips checksum
+                # verification in this library version
+                dest_file = local_path / blob.name[len(prefix):]
                 dest_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                logger.debug(f"Downloading {blob.name} -> {dest_file}")
-                blob.download_to_filename(str(dest_file))
-            
+                blob_file_pairs.append((blob, str(dest_file)))
+
+            # Download blobs concurrently; per-object latency is hidden so
+            # wall time approaches the slowest single transfer. CRC32C
+            # verification uses the hardware-accelerated google-crc32c
+            # extension instead of a Python-level MD5 over the weights.
+            results = transfer_manager.download_many(
+                blob_file_pairs,
+                download_kwargs={'checksum': 'crc32c'},
+                worker_type=transfer_manager.THREAD,
+                max_workers=min(8, len(blob_file_pairs)),
+                raise_exception=False
+            )
+
+            failed = False
+            for (blob, _), result in zip(blob_file_pairs, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to download {blob.name}: {result}")
+                    failed = True
+
+            if failed:
+                return False
+
             logger.info(f"Successfully downloaded to {local_path}")
             return True
             
@@ -161,6 +200,7 @@ class ModelStore:
                 
                 if self.download_from_gcs(gcs_prefix, local_path):
                     if self.model_exists_locally(language, gender):
+                        self._available_cache = None
                         return True, "Model downloaded from GCS"
                     else:
                         return False, "Download completed but required files missing"
@@ -195,6 +235,7 @@ class ModelStore:
                 
                 if self.download_from_gcs(gcs_prefix, local_path):
                     if self.vocoder_exists_locally(language, gender):
+                        self._available_cache = None
                         return True, "Vocoder downloaded from GCS"
                 
                 # Try Aryan group vocoder as fallback
@@ -204,6 +245,7 @@ class ModelStore:
                 
                 if self.download_from_gcs(gcs_prefix, local_path):
                     if self.vocoder_exists_locally(language, gender):
+                        self._available_cache = None
                         return True, "Vocoder downloaded from GCS (aryan)"
                 
                 return False, "Failed to download vocoder from GCS"
@@ -217,30 +259,38 @@ class ModelStore:
         Returns:
             Dictionary mapping language -> list of genders
         """
+        # Serve from cache to avoid re-statting every voice under frequent
+        # polling; new downloads invalidate the cache immediately
+        cached = self._available_cache
+        if cached is not None and time.monotonic() - cached[0] < self._available_cache_ttl:
+            return cached[1]
+
         available = {}
-        
+
         # Scan local models directory
         if not self.models_dir.exists():
             return available
-        
-        for lang_dir in self.models_dir.iterdir():
-            if not lang_dir.is_dir() or lang_dir.name == 'vocoder':
+
+        # Single walk over <language>/<gender>/model, pruning the shared
+        # vocoder tree and anything below the model directories, so the
+        # whole scan is one pass of directory reads
+        models_root = str(self.models_dir)
+        for root, dirs, files in os.walk(models_root, topdown=True,
+                                         followlinks=False):
+            rel = os.path.relpath(root, models_root)
+            if rel == '.':
+                dirs[:] = [d for d in dirs if d != 'vocoder']
                 continue
-            
-            language = lang_dir.name
-            genders = []
-            
-            for gender_dir in lang_dir.iterdir():
-                if not gender_dir.is_dir():
-                    continue
-                
-                gender = gender_dir.name
-                
-                # Check if model files exist
-                if self.model_exists_locally(language, gender):
-                    genders.append(gender)
-            
-            if genders:
-                available[language] = sorted(genders)
-        
+
+            parts = rel.split(os.sep)
+            if len(parts) >= 3:
+                if (parts[2] == 'model'
+                        and _REQUIRED_MODEL_FILES.issubset(files)):
+                    available.setdefault(parts[0], []).append(parts[1])
+                dirs[:] = []
+
+        available = {language: sorted(genders)
+                     for language, genders in available.items()}
+
+        self._available_cache = (time.monotonic(), available)
         return available
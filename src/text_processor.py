@@ -2,24 +2,35 @@
 Text Preprocessing Factory
 Provides appropriate text preprocessor based on language
 """
+import functools
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; includes the Devanagari danda/double danda
+# sentence terminators alongside Latin punctuation
+_JUNK_RE = re.compile(r'[#\n\r]+')
+_MULTI_WS_RE = re.compile(r'\s+')
+_SENT_SPLIT_RE = re.compile(r'[.!?;।॥]+')
+
 
 class TextPreprocessorFactory:
     """Factory for creating appropriate text preprocessors"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def get_preprocessor(language: str):
         """
         Get appropriate preprocessor for language
-        
+
         Args:
             language: Target language code
-        
+
         Returns:
-            Preprocessor instance
+            Preprocessor instance (cached per language: construction can
+            pull in dictionaries and rule files, and the male and female
+            voices of one language share the same preprocessor)
         """
         # Import here to avoid circular dependencies
         # These will be loaded from the original repo code
@@ -53,16 +64,12 @@ class StubPreprocessor:
         Returns:
             (preprocessed_text_list, phrases_list)
         """
-        import re
-        
         # Basic cleaning
-        text = re.sub(r'[#\n\r]+', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
+        text = _JUNK_RE.sub(' ', text)
+        text = _MULTI_WS_RE.sub(' ', text).strip()
+
         # Split by punctuation
-        phrases = re.split(r'[.!?;।]+', text)
-        phrases = [p.strip() for p in phrases if p.strip()]
+        phrases = [p.strip() for p in _SENT_SPLIT_RE.split(text) if p.strip()]
         
         logger.warning("Using stub preprocessor - results may not be optimal")
         return phrases, phrases
@@ -4,13 +4,17 @@ Integrates FastSpeech2 model, HiFi-GAN vocoder, and text preprocessing
 """
 import os
 import sys
+import contextlib
 import logging
 import re
-import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Tuple
 import numpy as np
+import orjson
 import torch
+from torch.nn.utils.weight_norm import WeightNorm
 import yaml
 import concurrent.futures
 
@@ -30,6 +34,117 @@ logger = logging.getLogger(__name__)
 SAMPLING_RATE = 22050
 MAX_WAV_VALUE = 32768.0
 
+# torch.load(mmap=True) needs PyTorch >= 2.1; tolerate suffixes like
+# '1.13.1+cu117' when parsing the version
+_TORCH_VERSION = tuple(
+    int(re.sub(r'\D.*', '', part) or 0)
+    for part in torch.__version__.split('.')[:2]
+)
+_TORCH_HAS_MMAP_LOAD = _TORCH_VERSION >= (2, 1)
+
+def _load_checkpoint(path, device):
+    """torch.load with mmap/weights_only on runtimes that support them"""
+    if _TORCH_HAS_MMAP_LOAD:
+        try:
+            return torch.load(path, map_location=device,
+                              mmap=True, weights_only=True)
+        except Exception as e:
+            logger.warning(f"mmap load failed for {path}: {e}. Using eager load.")
+    return torch.load(path, map_location=device)
+
+
+_TORCH_LOAD_PATCH_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def _mmap_torch_load():
+    """
+    Route torch.load calls made inside the block through the mmap path
+
+    espnet's Text2Speech loads its checkpoint internally, so this is the
+    only way to give model.pth the same mmap treatment as the vocoder.
+    weights_only is attempted first and silently dropped for checkpoints
+    that pickle non-tensor objects.
+    """
+    if not _TORCH_HAS_MMAP_LOAD:
+        yield
+        return
+
+    with _TORCH_LOAD_PATCH_LOCK:
+        original = torch.load
+
+        def patched(f, map_location=None, **kwargs):
+            if not kwargs:
+                try:
+                    return original(f, map_location=map_location,
+                                    mmap=True, weights_only=True)
+                except Exception:
+                    pass
+            return original(f, map_location=map_location, **kwargs)
+
+        torch.load = patched
+        try:
+            yield
+        finally:
+            torch.load = original
+
+
+# Markup tags and sentence boundaries in synthesis text, compiled once at
+# import; matched left to right in a single scan. A boundary is a run of
+# terminal punctuation (including the Devanagari danda) followed by
+# whitespace or end of input, so decimals like "1.5" and dotted
+# abbreviations stay inside their chunk instead of shredding it
+_TAG_RE = re.compile(r"<alpha=([0-9.]+)>|<sil=([0-9.]+)(ms|s)>|[.!?।॥]+(?:\s+|$)")
+
+# Chunks shorter than this (in words) are merged into a neighbour: tiny
+# chunks defeat vocoder batching and waste per-forward overhead
+_MIN_CHUNK_WORDS = 8
+
+# Mels per padded vocoder forward; groups are formed from length-sorted
+# chunks so padding within a group stays small
+_VOCODER_BUCKET_SIZE = 8
+
+
+class _OnnxVocoder:
+    """
+    HiFi-GAN generator running under ONNX Runtime
+
+    Presents the same callable interface as the eager module, so the
+    batched vocode path does not care which backend produced the audio.
+    With the TensorRT execution provider installed, the session builds
+    fused FP16 engines and caches them on disk next to the exported
+    graph; otherwise it runs on the CUDA or CPU providers.
+    """
+
+    def __init__(self, onnx_path: Path, device: str):
+        import onnxruntime as ort
+
+        available = ort.get_available_providers()
+        providers = []
+        if device == 'cuda' and 'TensorrtExecutionProvider' in available:
+            cache_dir = onnx_path.parent / 'trt_cache'
+            cache_dir.mkdir(exist_ok=True)
+            providers.append(('TensorrtExecutionProvider', {
+                'trt_fp16_enable': True,
+                'trt_engine_cache_enable': True,
+                'trt_engine_cache_path': str(cache_dir),
+            }))
+        if device == 'cuda' and 'CUDAExecutionProvider' in available:
+            providers.append('CUDAExecutionProvider')
+        providers.append('CPUExecutionProvider')
+
+        self.session = ort.InferenceSession(str(onnx_path),
+                                            providers=providers)
+
+    def parameters(self):
+        """No torch parameters; the vocode path probes dtype through this"""
+        return iter(())
+
+    def __call__(self, x: torch.Tensor) -> torch.Tensor:
+        (audio,) = self.session.run(
+            ['audio'], {'mel': x.detach().cpu().numpy()})
+        return torch.from_numpy(audio).to(x.device)
+
 
 class TTSEngine:
     """Main TTS synthesis engine"""
@@ -51,15 +166,40 @@ class TTSEngine:
         else:
             self.device = 'cpu'
             logger.info("Using CPU")
-        
+
+        # Inference-only process: disable autograd globally in addition to
+        # the inference_mode block around synthesis
+        torch.set_grad_enabled(False)
+
+        # Partition intraop threads across server worker processes so
+        # concurrent CPU forwards don't oversubscribe the cores; request
+        # parallelism comes from batching, not Python threads
+        if self.device == 'cpu':
+            n_threads = max(1, (os.cpu_count() or 1) // max(1, config.workers))
+            torch.set_num_threads(n_threads)
+            logger.info(f"Using {n_threads} torch intraop threads")
+
         # Initialize model store
         self.model_store = ModelStore(
             models_dir=config.models_dir,
             gcs_bucket=config.gcs_bucket
         )
         
-        # Cache for loaded models: key = (language, gender)
-        self.model_cache: Dict[Tuple[str, str], Tuple] = {}
+        # LRU cache for loaded models: key = (language, gender), capped at
+        # config.max_cached_models so long-running servers don't pin every
+        # voice ever requested in (GPU) memory
+        self.model_cache: 'OrderedDict[Tuple[str, str], Tuple]' = OrderedDict()
+        self._model_cache_lock = threading.Lock()
+
+        # config.yaml paths already patched, keyed by mtime, so reloading
+        # a model never reparses an up-to-date config
+        self._patched_configs: Dict[str, float] = {}
+
+        # Shared zero buffer sliced for <sil> segments, so each silence tag
+        # is a view instead of a fresh zero-fill
+        self._silence_pool = np.zeros(
+            int(config.max_silence_sec * self.sampling_rate), dtype=np.int16)
+        self._silence_pool.setflags(write=False)
         
         # Preload models if configured
         if config.preload_models:
@@ -68,13 +208,76 @@ class TTSEngine:
     def _preload_models(self):
         """Preload configured models into memory"""
         logger.info(f"Preloading {len(self.config.preload_models)} models...")
-        for language, gender in self.config.preload_models:
-            try:
-                self.load_model(language, gender)
-                logger.info(f"Preloaded: {language}/{gender}")
-            except Exception as e:
-                logger.error(f"Failed to preload {language}/{gender}: {e}")
+        # Load in parallel so GCS downloads and checkpoint reads overlap
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                executor.submit(self.load_model, language, gender): (language, gender)
+                for language, gender in self.config.preload_models
+            }
+            for future in concurrent.futures.as_completed(futures):
+                language, gender = futures[future]
+                try:
+                    future.result()
+                    logger.info(f"Preloaded: {language}/{gender}")
+                except Exception as e:
+                    logger.error(f"Failed to preload {language}/{gender}: {e}")
     
+    def _apply_precision(self, module):
+        """Apply the configured inference precision to a vocoder module"""
+        precision = self.config.precision
+        if precision == 'fp32':
+            return module
+
+        try:
+            if self.device == 'cuda':
+                # bf16 keeps fp32's exponent range (no overflow-prone
+                # activations) where the GPU supports it, degrading to
+                # fp16 tensor cores otherwise; anything else (int8, a
+                # typo) must not silently run half
+                if precision == 'bf16' and torch.cuda.is_bf16_supported():
+                    return module.to(dtype=torch.bfloat16)
+                if precision in ('fp16', 'bf16'):
+                    return module.half()
+                logger.warning(
+                    f"Precision '{precision}' not supported on CUDA, using fp32")
+                return module
+            if precision == 'int8':
+                # Dynamic quantization only covers Linear/RNN-family
+                # modules; the conv stack that dominates HiFi-GAN would be
+                # silently left in fp32, so don't pretend it applied.
+                # Int8 convs need static/FX quantization with calibration,
+                # which this path doesn't do.
+                logger.warning(
+                    "int8 is not supported for the conv-based vocoder; "
+                    "using fp32")
+                return module
+            logger.warning(f"Precision '{precision}' not supported on CPU, using fp32")
+        except Exception as e:
+            logger.warning(f"Failed to apply precision '{precision}': {e}. Using fp32.")
+        return module
+
+    @staticmethod
+    def _verify_weight_norm_removed(generator):
+        """
+        Ensure remove_weight_norm left no WeightNorm hooks or params behind
+
+        A surviving pre-forward hook recomputes weight = g * v / ||v|| on
+        every call, silently costing 5-10% vocoder latency.
+        """
+        stripped = 0
+        for module in generator.modules():
+            for hook_id, hook in list(module._forward_pre_hooks.items()):
+                if isinstance(hook, WeightNorm):
+                    del module._forward_pre_hooks[hook_id]
+                    stripped += 1
+        if stripped:
+            logger.warning(f"Stripped {stripped} lingering WeightNorm hooks from vocoder")
+
+        leftovers = [name for name, _ in generator.named_parameters()
+                     if name.endswith('weight_g') or name.endswith('weight_v')]
+        if leftovers:
+            logger.warning(f"Weight-norm parameters survived removal: {leftovers}")
+
     def load_vocoder(self, language: str, gender: str):
         """Load HiFi-GAN vocoder model"""
         # Ensure vocoder files are available
@@ -92,10 +295,9 @@ class TTSEngine:
         if not generator_file.exists():
             raise FileNotFoundError(f"Vocoder generator not found: {generator_file}")
         
-        # Load configuration
-        with open(config_file, 'r') as f:
-            data = f.read()
-        json_config = json.loads(data)
+        # Load configuration (orjson parses straight from bytes, an order
+        # of magnitude faster than the stdlib parser)
+        json_config = orjson.loads(config_file.read_bytes())
         h = AttrDict(json_config)
         
         torch.manual_seed(h.seed)
@@ -104,14 +306,119 @@ class TTSEngine:
         device = torch.device(self.device)
         generator = Generator(h).to(device)
         
-        state_dict_g = torch.load(generator_file, map_location=device)
+        # mmap avoids reading the checkpoint into the heap before the copy
+        # to device, and preloaded workers share the page-cache-backed
+        # mapping; weights_only also skips the pickle object traversal
+        state_dict_g = _load_checkpoint(generator_file, device)
         generator.load_state_dict(state_dict_g['generator'])
         generator.eval()
         generator.remove_weight_norm()
-        
-        logger.info(f"Loaded vocoder: {vocoder_path}")
+        self._verify_weight_norm_removed(generator)
+
+        # Optional ONNX Runtime backend: the generator is a static conv
+        # stack with no data-dependent control flow, so it exports
+        # cleanly, and the TensorRT provider fuses conv/activation/
+        # residual chains beyond what this torch runtime reaches. Any
+        # failure (onnxruntime missing, export error) falls back to the
+        # torch path below.
+        if self.config.vocoder_backend == 'onnxruntime':
+            try:
+                onnx_path = self._export_vocoder_onnx(
+                    generator, vocoder_path, h.num_mels)
+                onnx_vocoder = _OnnxVocoder(onnx_path, self.device)
+                logger.info(f"Loaded vocoder via ONNX Runtime: {onnx_path}")
+                return onnx_vocoder
+            except Exception as e:
+                logger.warning(
+                    f"ONNX Runtime vocoder unavailable: {e}. Using torch backend.")
+
+        generator = self._apply_precision(generator)
+
+        # On PyTorch 2.x, compile the conv stack: reduce-overhead captures
+        # CUDA Graphs and fuses the element-wise chains in the MRF residual
+        # blocks, stripping per-op launch overhead at batch size 1
+        compiled = False
+        if self.device == 'cuda' and hasattr(torch, 'compile'):
+            try:
+                generator = torch.compile(generator, mode='reduce-overhead')
+                compiled = True
+                logger.info("Compiled vocoder with torch.compile")
+            except Exception as e:
+                logger.warning(f"torch.compile failed for vocoder: {e}. Using eager mode.")
+
+        # Without compile (PyTorch 1.x, or a failed compile), TorchScript
+        # still fuses the leaky_relu/add chains in the residual blocks; the
+        # profiling executor finishes optimizing on the first few forwards
+        if not compiled:
+            try:
+                generator = torch.jit.script(generator)
+                generator = torch.jit.optimize_for_inference(generator)
+                logger.info("Scripted vocoder with TorchScript")
+            except Exception as e:
+                logger.warning(f"TorchScript fallback failed for vocoder: {e}. Using eager mode.")
+
+        logger.info(f"Loaded vocoder: {vocoder_path} (precision={self.config.precision})")
         return generator
-    
+
+    def _export_vocoder_onnx(self, generator, vocoder_path: Path,
+                             n_mels: int) -> Path:
+        """
+        Export the eager generator to ONNX with a dynamic time axis,
+        reusing an existing export that is newer than the checkpoint
+        """
+        onnx_path = vocoder_path / "generator.onnx"
+        generator_file = vocoder_path / "generator"
+        if (onnx_path.exists()
+                and onnx_path.stat().st_mtime >= generator_file.stat().st_mtime):
+            return onnx_path
+
+        dummy_mel = torch.randn(1, n_mels, 64, device=self.device)
+        torch.onnx.export(
+            generator, dummy_mel, str(onnx_path),
+            input_names=['mel'], output_names=['audio'],
+            dynamic_axes={'mel': {0: 'batch', 2: 'frames'},
+                          'audio': {0: 'batch', 2: 'samples'}},
+            opset_version=17
+        )
+        logger.info(f"Exported vocoder to ONNX: {onnx_path}")
+        return onnx_path
+
+    def _ensure_stats_paths(self, config_file: Path, model_path: Path):
+        """
+        Point the normalization stats entries in config.yaml at absolute
+        paths, rewriting the file only when they are stale
+
+        Parsing uses the libyaml C loader when available; an unchanged
+        config (checked via mtime) is not even reparsed.
+        """
+        key = str(config_file)
+        mtime = os.path.getmtime(key)
+        if self._patched_configs.get(key) == mtime:
+            return
+
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with open(config_file, "r") as f:
+            config = yaml.load(f, Loader=loader)
+
+        expected = {
+            "normalize_conf": str(model_path / "feats_stats.npz"),
+            "pitch_normalize_conf": str(model_path / "pitch_stats.npz"),
+            "energy_normalize_conf": str(model_path / "energy_stats.npz"),
+        }
+
+        stale = False
+        for section, stats_file in expected.items():
+            if config[section].get("stats_file") != stats_file:
+                config[section]["stats_file"] = stats_file
+                stale = True
+
+        if stale:
+            dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+            with open(config_file, "w") as f:
+                yaml.dump(config, f, Dumper=dumper)
+
+        self._patched_configs[key] = os.path.getmtime(key)
+
     def load_fastspeech2(self, language: str, gender: str):
         """Load FastSpeech2 TTS model"""
         # Ensure model files are available
@@ -130,27 +437,16 @@ class TTSEngine:
             raise FileNotFoundError(f"Model file not found: {model_file}")
         
         # Update config.yaml with absolute paths for stats files
-        with open(config_file, "r") as f:
-            config = yaml.safe_load(f)
-        
-        feat_path = model_path / "feats_stats.npz"
-        pitch_path = model_path / "pitch_stats.npz"
-        energy_path = model_path / "energy_stats.npz"
-        
-        config["normalize_conf"]["stats_file"] = str(feat_path)
-        config["pitch_normalize_conf"]["stats_file"] = str(pitch_path)
-        config["energy_normalize_conf"]["stats_file"] = str(energy_path)
-        
-        # Write updated config
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
-        
-        # Load model
-        tts_model = Text2Speech(
-            train_config=str(config_file),
-            model_file=str(model_file),
-            device=self.device
-        )
+        self._ensure_stats_paths(config_file, model_path)
+
+        # Load model (espnet reads the checkpoint itself, so patch its
+        # torch.load onto the mmap path for the duration)
+        with _mmap_torch_load():
+            tts_model = Text2Speech(
+                train_config=str(config_file),
+                model_file=str(model_file),
+                device=self.device
+            )
         
         logger.info(f"Loaded FastSpeech2 model: {model_path}")
         return tts_model
@@ -163,25 +459,46 @@ class TTSEngine:
             Tuple of (fastspeech2_model, vocoder, preprocessor)
         """
         cache_key = (language, gender)
-        
-        if cache_key in self.model_cache:
-            logger.debug(f"Using cached model: {language}/{gender}")
-            return self.model_cache[cache_key]
-        
+
+        with self._model_cache_lock:
+            cached = self.model_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached model: {language}/{gender}")
+                self.model_cache.move_to_end(cache_key)
+                return cached
+
         logger.info(f"Loading model: {language}/{gender}")
-        
-        # Load models
-        fs2_model = self.load_fastspeech2(language, gender)
-        vocoder = self.load_vocoder(language, gender)
-        
+
+        # Load both models concurrently (outside the cache lock so a slow
+        # load doesn't block requests for already-cached voices). They
+        # read independent files and the GIL is released during disk I/O
+        # and tensor loads, so the cold start costs roughly the slower of
+        # the two instead of their sum.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+            fs2_future = ex.submit(self.load_fastspeech2, language, gender)
+            vocoder_future = ex.submit(self.load_vocoder, language, gender)
+            fs2_model = fs2_future.result()
+            vocoder = vocoder_future.result()
+
         # Get appropriate preprocessor
         preprocessor = TextPreprocessorFactory.get_preprocessor(language)
-        
-        # Cache the loaded models
-        self.model_cache[cache_key] = (fs2_model, vocoder, preprocessor)
-        
+
+        # Cache the loaded models, evicting the least recently used voice
+        # when over capacity
+        evicted = False
+        with self._model_cache_lock:
+            while len(self.model_cache) >= self.config.max_cached_models:
+                old_key, (old_fs2, old_vocoder, _) = self.model_cache.popitem(last=False)
+                logger.info(f"Evicting cached model: {old_key[0]}/{old_key[1]}")
+                del old_fs2, old_vocoder
+                evicted = True
+            self.model_cache[cache_key] = (fs2_model, vocoder, preprocessor)
+
+        if evicted and self.device == 'cuda':
+            torch.cuda.empty_cache()
+
         logger.info(f"Model loaded and cached: {language}/{gender}")
-        return self.model_cache[cache_key]
+        return (fs2_model, vocoder, preprocessor)
     
     def extract_text_alpha_chunks(self, text: str, default_alpha: float = 1.0):
         """
@@ -194,59 +511,51 @@ class TTSEngine:
         Returns:
             List of tuples: (text, alpha, is_silence, silence_duration)
         """
-        alpha_pattern = r"<alpha=([0-9.]+)>"
-        sil_pattern = r"<sil=([0-9.]+)(ms|s)>"
-        
+        # Single left-to-right scan: every tag or sentence boundary flushes
+        # the text accumulated since the previous match, so the input is
+        # traversed once with no intermediate block/placeholder strings
         chunks = []
         alpha = default_alpha
-        
-        # Split by alpha tags
-        alpha_blocks = re.split(alpha_pattern, text)
-        i = 0
-        
-        while i < len(alpha_blocks):
-            if i == 0:
-                current_block = alpha_blocks[i]
-                i += 1
+        pos = 0
+
+        for match in _TAG_RE.finditer(text):
+            words = text[pos:match.start()].split()
+            pos = match.end()
+
+            if words:
+                chunks.append((" ".join(words), alpha, False, None))
+
+            if match.group(1) is not None:
+                # <alpha=...> applies to everything that follows
+                alpha = float(match.group(1))
+            elif match.group(2) is not None:
+                # <sil=...> inserts a silence chunk in place
+                value = float(match.group(2))
+                duration = value / 1000.0 if match.group(3) == "ms" else value
+                chunks.append(("", alpha, True, duration))
+            # otherwise a sentence boundary: the flush above was the point
+
+        tail = text[pos:].split()
+        if tail:
+            chunks.append((" ".join(tail), alpha, False, None))
+
+        # Merge undersized neighbours: adjacent text chunks with the same
+        # alpha are joined while either side is below the minimum, so a
+        # split after "Mr." or a trailing two-word sentence doesn't become
+        # its own vocoder forward
+        merged = []
+        for chunk in chunks:
+            if (merged
+                    and not chunk[2] and not merged[-1][2]
+                    and merged[-1][1] == chunk[1]
+                    and (len(merged[-1][0].split()) < _MIN_CHUNK_WORDS
+                         or len(chunk[0].split()) < _MIN_CHUNK_WORDS)):
+                merged[-1] = (merged[-1][0] + " " + chunk[0],
+                              chunk[1], False, None)
             else:
-                alpha = float(alpha_blocks[i])
-                i += 1
-                current_block = alpha_blocks[i] if i < len(alpha_blocks) else ""
-                i += 1
-            
-            # Find silence tags in current block
-            sil_matches = list(re.finditer(sil_pattern, current_block))
-            sil_placeholders = {}
-            
-            for j, match in enumerate(sil_matches):
-                tag = match.group(0)
-                value = float(match.group(1))
-                unit = match.group(2)
-                duration = value / 1000.0 if unit == "ms" else value
-                placeholder = f"__SIL_{j}__"
-                sil_placeholders[placeholder] = duration
-                current_block = current_block.replace(tag, f" {placeholder} ")
-            
-            # Split by sentences
-            sentences = [s.strip() for s in current_block.split('.') if s.strip()]
-            
-            for sentence in sentences:
-                words = sentence.split()
-                buffer = []
-                
-                for word in words:
-                    if word in sil_placeholders:
-                        if buffer:
-                            chunks.append((" ".join(buffer), alpha, False, None))
-                            buffer = []
-                        chunks.append(("", alpha, True, sil_placeholders[word]))
-                    else:
-                        buffer.append(word)
-                
-                if buffer:
-                    chunks.append((" ".join(buffer), alpha, False, None))
-        
-        return chunks
+                merged.append(chunk)
+
+        return merged
     
     def split_into_chunks(self, text: str, words_per_chunk: int = 100):
         """Split text into word chunks for processing"""
@@ -255,96 +564,211 @@ class TTSEngine:
                  for i in range(0, len(words), words_per_chunk)]
         return [' '.join(chunk) for chunk in chunks]
     
-    def synthesize_chunk(self, text: str, model, vocoder, alpha: float):
-        """Synthesize a single chunk of text"""
-        with torch.inference_mode():
-            # Generate mel-spectrograms
-            out = model(text, decode_conf={"alpha": alpha})
-            
-            x = out["feat_gen_denorm"].T.unsqueeze(0) * 2.3262
-            x = x.to(self.device)
-            
-            # Generate audio with vocoder
-            y_g_hat = vocoder(x)
-            audio = y_g_hat.squeeze()
-            audio = audio * MAX_WAV_VALUE
-            audio = audio.cpu().numpy().astype('int16')
-            
-            return audio
-    
-    def synthesize(self, text: str, language: str, gender: str, 
+    def _silence(self, n_samples: int) -> np.ndarray:
+        """Read-only silence of the given length, served from the pool"""
+        if n_samples <= len(self._silence_pool):
+            return self._silence_pool[:n_samples]
+        # Longer than the pool (rare): allocate for this one
+        return np.zeros(n_samples, dtype=np.int16)
+
+    def generate_mel(self, text: str, model, alpha: float):
+        """Run FastSpeech2 and return the denormalized mel for one chunk"""
+        out = model(text, decode_conf={"alpha": alpha})
+        # Text2Speech can hand the post-processed mel back on the CPU even
+        # with a CUDA device; move it over before scaling so the multiply
+        # runs in place on the device copy and later padding/transposing in
+        # the vocode path never touches host memory
+        mel = out["feat_gen_denorm"].to(self.device, non_blocking=True)
+        return mel.mul_(2.3262)  # (frames, n_mels)
+
+    def vocode_batch(self, mels, vocoder):
+        """
+        Run the vocoder over mels in length-sorted buckets
+
+        Sorting by frame count before bucketing keeps each padded batch
+        tight: a 10-word chunk is never padded out to a 100-word chunk's
+        length, so almost no upsampling work is spent on padding.
+
+        Args:
+            mels: List of (frames, n_mels) tensors
+            vocoder: HiFi-GAN generator
+
+        Returns:
+            List of int16 audio arrays, one per mel, in input order
+        """
+        order = sorted(range(len(mels)), key=lambda i: mels[i].shape[0])
+
+        audio_chunks = [None] * len(mels)
+        for start in range(0, len(order), _VOCODER_BUCKET_SIZE):
+            group = order[start:start + _VOCODER_BUCKET_SIZE]
+            group_audio = self._vocode_padded([mels[i] for i in group], vocoder)
+            for index, audio in zip(group, group_audio):
+                audio_chunks[index] = audio
+        return audio_chunks
+
+    def _vocode_padded(self, mels, vocoder):
+        """Run one padded vocoder forward over a group of similar-length mels"""
+        lengths = [mel.shape[0] for mel in mels]
+
+        # Pad to the longest chunk and batch as (B, n_mels, frames) so
+        # HiFi-GAN runs one forward instead of one launch per chunk
+        batch = torch.nn.utils.rnn.pad_sequence(mels, batch_first=True)
+        try:
+            param_dtype = next(vocoder.parameters()).dtype
+        except StopIteration:
+            # Frozen (optimize_for_inference) modules expose no parameters
+            param_dtype = torch.float32
+        x = batch.transpose(1, 2).contiguous().to(
+            device=self.device, dtype=param_dtype)
+
+        # Autocast the forward when running reduced precision on CUDA so
+        # intermediate ops pick half/bf16 kernels
+        if self.device == 'cuda' and param_dtype != torch.float32:
+            with torch.autocast(device_type='cuda', dtype=param_dtype):
+                y = vocoder(x)
+        else:
+            y = vocoder(x)
+
+        # Quantize to int16 on-device: clamp guards against out-of-range
+        # vocoder output, and moving 2 bytes/sample over PCIe instead of 4
+        # halves the transfer
+        y = y.squeeze(1).float()
+        pcm = (y.clamp_(-1.0, 1.0) * (MAX_WAV_VALUE - 1.0)).to(torch.int16)
+
+        # Upsampling factor recovered from the output itself; valid samples
+        # for chunk i are its mel frames times that factor
+        hop = pcm.shape[-1] // x.shape[-1]
+
+        if self.device == 'cuda':
+            # Concatenate the valid slices on-device and make one host
+            # copy instead of N small synchronized transfers. The copy is
+            # a plain synchronous .cpu(): nothing is queued behind it to
+            # overlap with, and a reusable pinned buffer can't be handed
+            # out here because the returned arrays are views that must
+            # survive the next bucket
+            flat = torch.cat([pcm[i, :n_frames * hop]
+                              for i, n_frames in enumerate(lengths)])
+            host = flat.cpu().numpy()
+
+            audio_chunks = []
+            offset = 0
+            for n_frames in lengths:
+                n_samples = n_frames * hop
+                audio_chunks.append(host[offset:offset + n_samples])
+                offset += n_samples
+            return audio_chunks
+
+        return [pcm[i, :n_frames * hop].numpy()
+                for i, n_frames in enumerate(lengths)]
+
+    def synthesize(self, text: str, language: str, gender: str,
                    alpha: float = 1.0) -> np.ndarray:
         """
         Synthesize speech from text
-        
+
         Args:
             text: Input text (supports <alpha> and <sil> tags)
             language: Target language
             gender: Voice gender (male/female)
             alpha: Default speed control (1.0 = normal, >1 = slower, <1 = faster)
-        
+
         Returns:
             Audio array (int16)
         """
-        # Validate text length
-        if len(text) > self.config.max_text_length:
-            raise ValueError(
-                f"Text too long ({len(text)} chars). "
-                f"Maximum: {self.config.max_text_length}"
-            )
-        
+        return self.synthesize_batch([text], language, gender, [alpha])[0]
+
+    def synthesize_batch(self, texts, language: str, gender: str,
+                         alphas=None):
+        """
+        Synthesize several texts for one voice in a single vocoder batch
+
+        Args:
+            texts: List of input texts (supports <alpha> and <sil> tags)
+            language: Target language
+            gender: Voice gender (male/female)
+            alphas: Per-text speed control (defaults to 1.0)
+
+        Returns:
+            List of int16 audio arrays, one per text, in input order
+        """
+        if alphas is None:
+            alphas = [1.0] * len(texts)
+
+        # Validate text lengths
+        for text in texts:
+            if len(text) > self.config.max_text_length:
+                raise ValueError(
+                    f"Text too long ({len(text)} chars). "
+                    f"Maximum: {self.config.max_text_length}"
+                )
+
         # Load model, vocoder, and preprocessor
         model, vocoder, preprocessor = self.load_model(language, gender)
-        
-        # Extract chunks with alpha and silence tags
-        text_alpha_chunks = self.extract_text_alpha_chunks(text, alpha)
-        
-        audio_arr = []
-        
-        # Process each chunk
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            futures = []
-            
-            for chunk_text, alpha_val, is_silence, sil_duration in text_alpha_chunks:
-                if is_silence:
-                    # Generate silence
-                    silence_samples = int(sil_duration * self.sampling_rate)
-                    silence_audio = np.zeros(silence_samples, dtype=np.int16)
-                    futures.append(silence_audio)
-                else:
+
+        # Plan each text as a sequence of silence and mel segments; all
+        # mels across all texts share one batched vocoder forward
+        mels = []
+        plans = []
+
+        with torch.inference_mode():
+            for text, default_alpha in zip(texts, alphas):
+                segments = []
+                text_alpha_chunks = self.extract_text_alpha_chunks(
+                    text, default_alpha)
+
+                for chunk_text, alpha_val, is_silence, sil_duration in text_alpha_chunks:
+                    if is_silence:
+                        silence_samples = int(sil_duration * self.sampling_rate)
+                        segments.append(('silence', silence_samples))
+                        continue
+
                     if not chunk_text.strip():
                         continue
-                    
+
                     # Preprocess text
                     preprocessed_text, _ = preprocessor.preprocess(
                         chunk_text, language, gender
                     )
                     preprocessed_text = " ".join(preprocessed_text)
-                    
-                    # Submit synthesis task
-                    future = executor.submit(
-                        self.synthesize_chunk,
-                        preprocessed_text,
-                        model,
-                        vocoder,
-                        alpha_val
-                    )
-                    futures.append(future)
-            
-            # Collect results
-            for item in futures:
-                if isinstance(item, np.ndarray):
-                    audio_arr.append(item)
+
+                    segments.append(('audio', len(mels)))
+                    mels.append(self.generate_mel(
+                        preprocessed_text, model, alpha_val))
+
+                plans.append(segments)
+
+            audio_chunks = self.vocode_batch(mels, vocoder) if mels else []
+
+        # Reassemble each text's waveform from its segments
+        results = []
+        for segments in plans:
+            audio_arr = []
+            for kind, value in segments:
+                if kind == 'silence':
+                    audio_arr.append(self._silence(value))
                 else:
-                    audio_arr.append(item.result())
-        
-        # Concatenate all audio chunks
-        if not audio_arr:
-            # Return silence if no audio generated
-            return np.zeros(int(0.5 * self.sampling_rate), dtype=np.int16)
-        
-        result_array = np.concatenate(audio_arr, axis=0)
-        return result_array
+                    audio_arr.append(audio_chunks[value])
+
+            if not audio_arr:
+                # Return silence if no audio generated
+                results.append(self._silence(int(0.5 * self.sampling_rate)))
+                continue
+
+            if len(audio_arr) == 1:
+                # Single chunk: hand it back without a copy
+                results.append(audio_arr[0])
+                continue
+
+            # Preallocate the full waveform and write each chunk by offset
+            total = sum(chunk.shape[0] for chunk in audio_arr)
+            waveform = np.empty(total, dtype=np.int16)
+            offset = 0
+            for chunk in audio_arr:
+                waveform[offset:offset + chunk.shape[0]] = chunk
+                offset += chunk.shape[0]
+            results.append(waveform)
+
+        return results
     
     def get_available_models(self) -> dict:
         """Get dictionary of available language/gender combinations"""